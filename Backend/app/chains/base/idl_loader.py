@@ -10,16 +10,18 @@ class BaseIDLLoader(ABC):
     async def fetch_idl(self, program_id: str) -> Optional[Dict[str, Any]]:
         pass
     
+    # parse_* return chain-specific records (dicts or typed structs) that the
+    # routers encode as JSON
     @abstractmethod
-    def parse_instructions(self, idl: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def parse_instructions(self, idl: Dict[str, Any]) -> List[Any]:
         pass
     
     @abstractmethod
-    def parse_types(self, idl: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def parse_types(self, idl: Dict[str, Any]) -> List[Any]:
         pass
     
     @abstractmethod
-    def parse_accounts(self, idl: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def parse_accounts(self, idl: Dict[str, Any]) -> List[Any]:
         pass
     
     @abstractmethod
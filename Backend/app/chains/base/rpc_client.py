@@ -1,13 +1,50 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
+import asyncio
 import httpx
+import orjson
 
 
 class BaseRPCClient(ABC):
+    MAX_CONNECTIONS = 200
+    MAX_KEEPALIVE_CONNECTIONS = 64
+    # Keep idle connections around long enough to skip TLS handshakes between calls
+    KEEPALIVE_EXPIRY = 60.0
+    RETRY_STATUS_CODES = frozenset({429, 503})
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 0.25
+
     def __init__(self, rpc_url: Optional[str] = None, timeout: float = 30.0):
         self.rpc_url = rpc_url or self.get_default_rpc_url()
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        # HTTP/2 lets concurrent RPC calls share a single connection
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(
+                max_connections=self.MAX_CONNECTIONS,
+                max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=self.KEEPALIVE_EXPIRY,
+            ),
+            headers={"content-type": "application/json"},
+        )
+
+    async def _post_json(self, payload: Any) -> Any:
+        """
+        POSTs a JSON payload to the RPC URL, backing off and retrying on rate limits.
+        """
+        body = orjson.dumps(payload)
+        for attempt in range(self.MAX_RETRIES + 1):
+            response = await self.client.post(self.rpc_url, content=body)
+            if (
+                response.status_code not in self.RETRY_STATUS_CODES
+                or attempt == self.MAX_RETRIES
+            ):
+                break
+            await asyncio.sleep(self.RETRY_BACKOFF * 2**attempt)
+
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     @classmethod
     @abstractmethod
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any
 
 
 class BaseTxBuilder(ABC):
@@ -11,7 +11,7 @@ class BaseTxBuilder(ABC):
     def build_instruction(
         self,
         program_id: str,
-        accounts: List[Dict[str, Any]],
+        accounts: Iterable[Any],
         data: bytes
     ) -> Any:
         pass
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+import time
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Tuple
+from .rpc_client import SolanaRPCClient
+from .rpc_pool import acquire_rpc_client, is_pooled_rpc_url
+
+logger = logging.getLogger(__name__)
+
+# A blockhash stays usable for ~60-90s, so one a few seconds old is safe to reuse
+BLOCKHASH_TTL = 5.0
+# Refresh a little faster than the TTL so prefetched URLs never see a miss
+BLOCKHASH_REFRESH_INTERVAL = 4.0
+
+# rpc_url -> (blockhash, expires_at); only pooled URLs are cached, which bounds it
+_blockhashes: Dict[str, Tuple[str, float]] = {}
+# rpc_url -> in-flight fetch; concurrent misses share its result or exception
+_fetches: Dict[str, asyncio.Task] = {}
+_refresh_tasks: List[asyncio.Task] = []
+
+
+def _get_cached(rpc_url: str) -> Optional[str]:
+    entry = _blockhashes.get(rpc_url)
+    if entry and entry[1] > time.monotonic():
+        return entry[0]
+    return None
+
+
+async def _fetch_blockhash(rpc_url: str) -> str:
+    async with acquire_rpc_client(rpc_url) as rpc_client:
+        response = await rpc_client.get_latest_blockhash()
+    blockhash = response["blockhash"]
+    _blockhashes[rpc_url] = (blockhash, time.monotonic() + BLOCKHASH_TTL)
+    return blockhash
+
+
+async def get_blockhash(rpc_url: Optional[str] = None) -> str:
+    """
+    Returns a recent blockhash, possibly a few seconds old. Callers that sign must
+    fetch a fresh one: identical signed transactions are rejected as duplicates.
+    """
+    url = rpc_url or SolanaRPCClient.get_default_rpc_url()
+    if not is_pooled_rpc_url(url):
+        async with acquire_rpc_client(url) as client:
+            response = await client.get_latest_blockhash()
+        return response["blockhash"]
+
+    blockhash = _get_cached(url)
+    if blockhash:
+        return blockhash
+
+    task = _fetches.get(url)
+    if task is None:
+        task = _fetches[url] = asyncio.ensure_future(_fetch_blockhash(url))
+        task.add_done_callback(partial(_fetch_done, url))
+    # Shielded so one caller's cancellation does not abort the shared fetch
+    return await asyncio.shield(task)
+
+
+def _fetch_done(rpc_url: str, task: asyncio.Task) -> None:
+    if _fetches.get(rpc_url) is task:
+        del _fetches[rpc_url]
+    # Mark the exception retrieved in case every waiter was cancelled
+    if not task.cancelled():
+        task.exception()
+
+
+async def _refresh_loop(rpc_url: str) -> None:
+    while True:
+        try:
+            await _fetch_blockhash(rpc_url)
+        except Exception as e:
+            logger.warning("Failed to refresh blockhash for %s: %s", rpc_url, e)
+        await asyncio.sleep(BLOCKHASH_REFRESH_INTERVAL)
+
+
+def start_blockhash_refreshers(rpc_urls: Iterable[str]) -> None:
+    for rpc_url in rpc_urls:
+        _refresh_tasks.append(asyncio.create_task(_refresh_loop(rpc_url)))
+
+
+async def stop_blockhash_refreshers() -> None:
+    for task in _refresh_tasks:
+        task.cancel()
+    await asyncio.gather(*_refresh_tasks, return_exceptions=True)
+    _refresh_tasks.clear()
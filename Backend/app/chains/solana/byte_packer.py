@@ -1,9 +1,48 @@
 import struct
 import base58
 import base64
+from functools import lru_cache
 from typing import List, Any, Dict
 from ..base.byte_packer import BaseBytePacker
 
+# Precompiled little-endian formats, reused for every field
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_I8 = struct.Struct("<b")
+_I16 = struct.Struct("<h")
+_I32 = struct.Struct("<i")
+_I64 = struct.Struct("<q")
+
+
+@lru_cache(maxsize=256)
+def _layout_struct(fmt: str) -> struct.Struct:
+    return struct.Struct("<" + fmt)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _as_flag(value: Any) -> int:
+    return 1 if value else 0
+
+
+# struct format and value conversion for fields packable in one struct call,
+# matching the masking done by the per-field packers
+_NUMERIC_FIELDS = {
+    "u8": ("B", lambda value: value & 0xFF),
+    "u16": ("H", lambda value: value & 0xFFFF),
+    "u32": ("I", lambda value: value & 0xFFFFFFFF),
+    "u64": ("Q", lambda value: value & 0xFFFFFFFFFFFFFFFF),
+    "i8": ("b", _identity),
+    "i16": ("h", _identity),
+    "i32": ("i", _identity),
+    "i64": ("q", _identity),
+    "bool": ("B", _as_flag),
+}
+
 
 class SolanaBytePacker(BaseBytePacker):
     SUPPORTED_TYPES = [
@@ -24,56 +63,42 @@ class SolanaBytePacker(BaseBytePacker):
     ]
 
     def pack_field(self, field_type: str, value: Any) -> bytes:
-        pack_methods = {
-            "u8": self._pack_u8,
-            "u16": self._pack_u16,
-            "u32": self._pack_u32,
-            "u64": self._pack_u64,
-            "u128": self._pack_u128,
-            "i8": self._pack_i8,
-            "i16": self._pack_i16,
-            "i32": self._pack_i32,
-            "i64": self._pack_i64,
-            "i128": self._pack_i128,
-            "bool": self._pack_bool,
-            "pubkey": self._pack_pubkey,
-            "string": self._pack_string,
-            "bytes": self._pack_bytes,
-        }
-
-        pack_fn = pack_methods.get(field_type.lower())
+        pack_fn = _PACKERS.get(field_type.lower())
         if not pack_fn:
             raise ValueError(f"Unknown type: {field_type}")
 
         return pack_fn(value)
 
     def pack_layout(self, layout: List[Dict[str, Any]]) -> bytes:
-        result = b""
+        parts = []
+        # Consecutive fixed-width numeric fields are packed with a single struct call
+        run_format = []
+        run_values = []
+
         for field in layout:
             field_type = field.get("type")
             value = field.get("value")
-            result += self.pack_field(field_type, value)
-        return result
+
+            numeric = _NUMERIC_FIELDS.get(field_type.lower())
+            if numeric is not None:
+                fmt, convert = numeric
+                run_format.append(fmt)
+                run_values.append(convert(value))
+                continue
+
+            if run_format:
+                parts.append(_layout_struct("".join(run_format)).pack(*run_values))
+                run_format.clear()
+                run_values.clear()
+            parts.append(self.pack_field(field_type, value))
+
+        if run_format:
+            parts.append(_layout_struct("".join(run_format)).pack(*run_values))
+
+        return b"".join(parts)
 
     def unpack_field(self, field_type: str, data: bytes) -> Any:
-        unpack_methods = {
-            "u8": self._unpack_u8,
-            "u16": self._unpack_u16,
-            "u32": self._unpack_u32,
-            "u64": self._unpack_u64,
-            "u128": self._unpack_u128,
-            "i8": self._unpack_i8,
-            "i16": self._unpack_i16,
-            "i32": self._unpack_i32,
-            "i64": self._unpack_i64,
-            "i128": self._unpack_i128,
-            "bool": self._unpack_bool,
-            "pubkey": self._unpack_pubkey,
-            "string": self._unpack_string,
-            "bytes": self._unpack_bytes,
-        }
-
-        unpack_fn = unpack_methods.get(field_type.lower())
+        unpack_fn = _UNPACKERS.get(field_type.lower())
         if not unpack_fn:
             raise ValueError(f"Unknown type: {field_type}")
 
@@ -82,12 +107,15 @@ class SolanaBytePacker(BaseBytePacker):
     def unpack_layout(self, layout: List[Dict[str, Any]], data: bytes) -> List[Any]:
         result = []
         offset = 0
+        # Slicing a memoryview avoids copying the remaining buffer for every field
+        view = memoryview(data)
         for field in layout:
             field_type = field.get("type")
-            unpacked_value = self.unpack_field(field_type, data[offset:])
+            remaining = view[offset:]
+            unpacked_value = self.unpack_field(field_type, remaining)
             result.append(unpacked_value)
             # Calculate the size consumed
-            size = self._get_field_size(field_type, data[offset:])
+            size = self._get_field_size(field_type, remaining)
             offset += size
         return result
 
@@ -96,19 +124,19 @@ class SolanaBytePacker(BaseBytePacker):
 
     @staticmethod
     def _pack_u8(value: int) -> bytes:
-        return struct.pack("<B", value & 0xFF)
+        return _U8.pack(value & 0xFF)
 
     @staticmethod
     def _pack_u16(value: int) -> bytes:
-        return struct.pack("<H", value & 0xFFFF)
+        return _U16.pack(value & 0xFFFF)
 
     @staticmethod
     def _pack_u32(value: int) -> bytes:
-        return struct.pack("<I", value & 0xFFFFFFFF)
+        return _U32.pack(value & 0xFFFFFFFF)
 
     @staticmethod
     def _pack_u64(value: int) -> bytes:
-        return struct.pack("<Q", value & 0xFFFFFFFFFFFFFFFF)
+        return _U64.pack(value & 0xFFFFFFFFFFFFFFFF)
 
     @staticmethod
     def _pack_u128(value: int) -> bytes:
@@ -116,19 +144,19 @@ class SolanaBytePacker(BaseBytePacker):
 
     @staticmethod
     def _pack_i8(value: int) -> bytes:
-        return struct.pack("<b", value)
+        return _I8.pack(value)
 
     @staticmethod
     def _pack_i16(value: int) -> bytes:
-        return struct.pack("<h", value)
+        return _I16.pack(value)
 
     @staticmethod
     def _pack_i32(value: int) -> bytes:
-        return struct.pack("<i", value)
+        return _I32.pack(value)
 
     @staticmethod
     def _pack_i64(value: int) -> bytes:
-        return struct.pack("<q", value)
+        return _I64.pack(value)
 
     @staticmethod
     def _pack_i128(value: int) -> bytes:
@@ -136,7 +164,7 @@ class SolanaBytePacker(BaseBytePacker):
 
     @staticmethod
     def _pack_bool(value: bool) -> bytes:
-        return struct.pack("<B", 1 if value else 0)
+        return _U8.pack(1 if value else 0)
 
     @staticmethod
     def _pack_pubkey(value: str) -> bytes:
@@ -148,7 +176,7 @@ class SolanaBytePacker(BaseBytePacker):
     @staticmethod
     def _pack_string(value: str) -> bytes:
         encoded = value.encode("utf-8")
-        length = struct.pack("<I", len(encoded))
+        length = _U32.pack(len(encoded))
         return length + encoded
 
     @staticmethod
@@ -162,19 +190,19 @@ class SolanaBytePacker(BaseBytePacker):
 
     @staticmethod
     def _unpack_u8(data: bytes) -> int:
-        return struct.unpack("<B", data[:1])[0]
+        return _U8.unpack_from(data)[0]
 
     @staticmethod
     def _unpack_u16(data: bytes) -> int:
-        return struct.unpack("<H", data[:2])[0]
+        return _U16.unpack_from(data)[0]
 
     @staticmethod
     def _unpack_u32(data: bytes) -> int:
-        return struct.unpack("<I", data[:4])[0]
+        return _U32.unpack_from(data)[0]
 
     @staticmethod
     def _unpack_u64(data: bytes) -> int:
-        return struct.unpack("<Q", data[:8])[0]
+        return _U64.unpack_from(data)[0]
 
     @staticmethod
     def _unpack_u128(data: bytes) -> int:
@@ -182,19 +210,19 @@ class SolanaBytePacker(BaseBytePacker):
 
     @staticmethod
     def _unpack_i8(data: bytes) -> int:
-        return struct.unpack("<b", data[:1])[0]
+        return _I8.unpack_from(data)[0]
 
     @staticmethod
     def _unpack_i16(data: bytes) -> int:
-        return struct.unpack("<h", data[:2])[0]
+        return _I16.unpack_from(data)[0]
 
     @staticmethod
     def _unpack_i32(data: bytes) -> int:
-        return struct.unpack("<i", data[:4])[0]
+        return _I32.unpack_from(data)[0]
 
     @staticmethod
     def _unpack_i64(data: bytes) -> int:
-        return struct.unpack("<q", data[:8])[0]
+        return _I64.unpack_from(data)[0]
 
     @staticmethod
     def _unpack_i128(data: bytes) -> int:
@@ -202,16 +230,16 @@ class SolanaBytePacker(BaseBytePacker):
 
     @staticmethod
     def _unpack_bool(data: bytes) -> bool:
-        return struct.unpack("<B", data[:1])[0] != 0
+        return _U8.unpack_from(data)[0] != 0
 
     @staticmethod
     def _unpack_pubkey(data: bytes) -> str:
-        return base58.b58encode(data[:32]).decode("utf-8")
+        return base58.b58encode(bytes(data[:32])).decode("utf-8")
 
     @staticmethod
     def _unpack_string(data: bytes) -> str:
-        length = struct.unpack("<I", data[:4])[0]
-        return data[4 : 4 + length].decode("utf-8")
+        length = _U32.unpack_from(data)[0]
+        return bytes(data[4 : 4 + length]).decode("utf-8")
 
     @staticmethod
     def _unpack_bytes(data: bytes) -> str:
@@ -220,31 +248,69 @@ class SolanaBytePacker(BaseBytePacker):
         return data.hex()
 
     def _get_field_size(self, field_type: str, data: bytes) -> int:
-        size_map = {
-            "u8": 1,
-            "u16": 2,
-            "u32": 4,
-            "u64": 8,
-            "u128": 16,
-            "i8": 1,
-            "i16": 2,
-            "i32": 4,
-            "i64": 8,
-            "i128": 16,
-            "bool": 1,
-            "pubkey": 32,
-        }
-
-        if field_type.lower() in size_map:
-            return size_map[field_type.lower()]
-        elif field_type.lower() == "string":
+        field_type = field_type.lower()
+        size = _FIXED_SIZES.get(field_type)
+        if size is not None:
+            return size
+        elif field_type == "string":
             if len(data) < 4:
                 raise ValueError("Not enough data for string length")
-            length = struct.unpack("<I", data[:4])[0]
+            length = _U32.unpack_from(data)[0]
             return 4 + length
-        elif field_type.lower() == "bytes":
+        elif field_type == "bytes":
             # For bytes, since we don't know the length, assume the rest of the data
             # This is a limitation; in practice, bytes fields need length info
             return len(data)
         else:
             raise ValueError(f"Unknown type for size calculation: {field_type}")
+
+
+# Dispatch tables are built once at import instead of on every call
+_PACKERS = {
+    "u8": SolanaBytePacker._pack_u8,
+    "u16": SolanaBytePacker._pack_u16,
+    "u32": SolanaBytePacker._pack_u32,
+    "u64": SolanaBytePacker._pack_u64,
+    "u128": SolanaBytePacker._pack_u128,
+    "i8": SolanaBytePacker._pack_i8,
+    "i16": SolanaBytePacker._pack_i16,
+    "i32": SolanaBytePacker._pack_i32,
+    "i64": SolanaBytePacker._pack_i64,
+    "i128": SolanaBytePacker._pack_i128,
+    "bool": SolanaBytePacker._pack_bool,
+    "pubkey": SolanaBytePacker._pack_pubkey,
+    "string": SolanaBytePacker._pack_string,
+    "bytes": SolanaBytePacker._pack_bytes,
+}
+
+_UNPACKERS = {
+    "u8": SolanaBytePacker._unpack_u8,
+    "u16": SolanaBytePacker._unpack_u16,
+    "u32": SolanaBytePacker._unpack_u32,
+    "u64": SolanaBytePacker._unpack_u64,
+    "u128": SolanaBytePacker._unpack_u128,
+    "i8": SolanaBytePacker._unpack_i8,
+    "i16": SolanaBytePacker._unpack_i16,
+    "i32": SolanaBytePacker._unpack_i32,
+    "i64": SolanaBytePacker._unpack_i64,
+    "i128": SolanaBytePacker._unpack_i128,
+    "bool": SolanaBytePacker._unpack_bool,
+    "pubkey": SolanaBytePacker._unpack_pubkey,
+    "string": SolanaBytePacker._unpack_string,
+    "bytes": SolanaBytePacker._unpack_bytes,
+}
+
+_FIXED_SIZES = {
+    "u8": 1,
+    "u16": 2,
+    "u32": 4,
+    "u64": 8,
+    "u128": 16,
+    "i8": 1,
+    "i16": 2,
+    "i32": 4,
+    "i64": 8,
+    "i128": 16,
+    "bool": 1,
+    "pubkey": 32,
+}
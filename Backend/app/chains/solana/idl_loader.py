@@ -1,44 +1,272 @@
 from http import client
-import json
+import orjson
+import msgspec
 import zlib
 import base64
 import hashlib
-from typing import Optional, Dict, Any, List, Tuple
+import struct
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
 from solders.pubkey import Pubkey
-from solana.rpc.async_api import AsyncClient
 from ..base.idl_loader import BaseIDLLoader
 from .rpc_client import SolanaRPCClient
-from anchorpy.provider import Provider, Wallet
-from anchorpy.program.core import Program
-from anchorpy import Idl
 
+if TYPE_CHECKING:
+    # anchorpy is heavy to import; it is loaded lazily by the methods that need it
+    from anchorpy.program.core import Program
+    from anchorpy import Idl
+
+logger = logging.getLogger(__name__)
 
 ANCHOR_IDL_SEED = b"anchor:idl"
 ANCHOR_DISCRIMINATOR_SIZE = 8
+# IDL account data after the discriminator: authority + u32 length + zlib payload
+IDL_AUTHORITY_SIZE = 32
+
+
+@lru_cache(maxsize=8192)
+def _pubkey_from_string(address: str) -> Pubkey:
+    return Pubkey.from_string(address)
 
 
+@lru_cache(maxsize=8192)
 def get_idl_address(program_id: str) -> Tuple[Pubkey, int]:
-    program_pubkey = Pubkey.from_string(program_id)
-    seeds = [ANCHOR_IDL_SEED]
-    return Pubkey.find_program_address(seeds, program_pubkey)
+    # Anchor stores the IDL at a seeded address derived from the program's base PDA
+    program_pubkey = _pubkey_from_string(program_id)
+    base, bump = Pubkey.find_program_address([], program_pubkey)
+    idl_address = Pubkey.create_with_seed(
+        base, ANCHOR_IDL_SEED.decode(), program_pubkey
+    )
+    return idl_address, bump
 
 
+@lru_cache(maxsize=4096)
 def compute_discriminator(name: str, prefix: str = "global") -> bytes:
     preimage = f"{prefix}:{name}"
     return hashlib.sha256(preimage.encode()).digest()[:8]
 
 
+def _needs_discriminator_compute(idl: Dict[str, Any]) -> bool:
+    # Anchor 0.30+ IDLs carry metadata.spec and always ship precomputed discriminators
+    metadata = idl.get("metadata")
+    return not (isinstance(metadata, dict) and "spec" in metadata)
+
+
+def _wrap_inner(key: str):
+    def handler(node: Dict[str, Any], stack: List[Tuple[Any, Any, Any]]) -> Any:
+        serialized = {key: None}
+        stack.append((serialized, key, node[key]))
+        return serialized
+
+    return handler
+
+
+def _wrap_array(node: Dict[str, Any], stack: List[Tuple[Any, Any, Any]]) -> Any:
+    array = node["array"]
+    serialized_array = [None, array[1]]
+    stack.append((serialized_array, 0, array[0]))
+    return {"array": serialized_array}
+
+
+def _passthrough_defined(
+    node: Dict[str, Any], stack: List[Tuple[Any, Any, Any]]
+) -> Any:
+    return {"defined": node["defined"]}
+
+
+# Dispatch table for composite IDL types, keyed by the type's single key
+_TYPE_HANDLERS = {
+    "vec": _wrap_inner("vec"),
+    "option": _wrap_inner("option"),
+    "coption": _wrap_inner("coption"),
+    "array": _wrap_array,
+    "defined": _passthrough_defined,
+}
+
+
+class ParsedInstructionAccount(
+    msgspec.Struct, frozen=True, rename={"is_mut": "isMut", "is_signer": "isSigner"}
+):
+    name: str
+    is_mut: bool
+    is_signer: bool
+    docs: List[str]
+    optional: bool
+
+
+class ParsedArg(msgspec.Struct, frozen=True):
+    name: str
+    type: Any
+
+
+# kw_only lets the optional discriminator keep its place in the field order
+class ParsedInstruction(msgspec.Struct, frozen=True, kw_only=True):
+    name: str
+    # None for an Anchor 0.30+ instruction that ships without one
+    discriminator: Optional[List[int]] = None
+    accounts: List[ParsedInstructionAccount]
+    args: List[ParsedArg]
+    docs: List[str]
+
+
+class ParsedTypeDef(msgspec.Struct, frozen=True, omit_defaults=True):
+    name: str
+    type_def: Any
+    discriminator: Optional[List[int]] = None
+
+
+@dataclass(slots=True)
+class ParsedIDL:
+    instructions: List[ParsedInstruction] = field(default_factory=list)
+    accounts: List[ParsedTypeDef] = field(default_factory=list)
+    types: List[ParsedTypeDef] = field(default_factory=list)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    # Instruction name -> index into `instructions`
+    by_name: Dict[str, int] = field(default_factory=dict)
+
+
 class SolanaIDLLoader(BaseIDLLoader):
+    IDL_CACHE_TTL = 300.0
+    IDL_CACHE_MAX_ENTRIES = 256
+    PROGRAM_CACHE_MAX_ENTRIES = 64
+
+    # Shared across loader instances, keyed by (rpc_url, program_id)
+    _idl_cache: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = (
+        OrderedDict()
+    )
+    # In-flight fetches; concurrent callers for a key share one task's outcome
+    _idl_fetches: "Dict[Tuple[str, str], asyncio.Task]" = {}
+    # Parsed anchorpy Idl objects keyed by IDL content hash; independent of any provider
+    _idl_object_cache: "OrderedDict[str, Idl]" = OrderedDict()
+
     def __init__(self, rpc_client: SolanaRPCClient):
         self.rpc_client = rpc_client
         self.rpc_url = rpc_client.rpc_url
+        # Programs hold this loader's provider, so they are cached per instance
+        self._program_cache: "OrderedDict[Tuple[str, str], Program]" = OrderedDict()
+
+    @classmethod
+    def invalidate(cls, program_id: str) -> None:
+        """
+        Drops every cached IDL for the program, whichever RPC URL it was fetched from.
+        """
+        for key in [key for key in cls._idl_cache if key[1] == program_id]:
+            del cls._idl_cache[key]
+
+    def _get_cached_idl(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        entry = self._idl_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, idl = entry
+        if expires_at < time.monotonic():
+            del self._idl_cache[key]
+            return None
+        self._idl_cache.move_to_end(key)
+        return idl
+
+    def _store_cached_idl(self, key: Tuple[str, str], idl: Dict[str, Any]) -> None:
+        self._idl_cache[key] = (time.monotonic() + self.IDL_CACHE_TTL, idl)
+        self._idl_cache.move_to_end(key)
+        while len(self._idl_cache) > self.IDL_CACHE_MAX_ENTRIES:
+            self._idl_cache.popitem(last=False)
 
     async def fetch_idl(self, program_id: str):
-        client = AsyncClient(self.rpc_url)
-        provider = Provider(client, Wallet.dummy())
-        idl = await Program.fetch_idl(Pubkey.from_string(program_id), provider)
+        key = (self.rpc_url, program_id)
+        idl = self._get_cached_idl(key)
+        if idl is not None:
+            return idl
 
-        return json.loads(idl.to_json()) if idl else None
+        task = self._idl_fetches.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store_idl(key, program_id))
+            self._idl_fetches[key] = task
+            task.add_done_callback(partial(self._idl_fetch_done, key))
+        # Shielded so one caller's cancellation does not abort the shared fetch
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store_idl(
+        self, key: Tuple[str, str], program_id: str
+    ) -> Optional[Dict[str, Any]]:
+        idl = await self._fetch_idl_uncached(program_id)
+        if idl is not None:
+            self._store_cached_idl(key, idl)
+        return idl
+
+    @classmethod
+    def _idl_fetch_done(cls, key: Tuple[str, str], task: asyncio.Task) -> None:
+        if cls._idl_fetches.get(key) is task:
+            del cls._idl_fetches[key]
+        # Mark the exception retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def fetch_idls(
+        self, program_ids: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetches the IDLs of several programs with a single getMultipleAccounts call.
+        Programs whose IDL account cannot be decoded come back as None.
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        missing = []
+        for program_id in program_ids:
+            idl = self._get_cached_idl((self.rpc_url, program_id))
+            if idl is None:
+                missing.append(program_id)
+            results[program_id] = idl
+
+        if not missing:
+            return results
+
+        addresses = [str(get_idl_address(pid)[0]) for pid in missing]
+        accounts = await self.rpc_client.get_multiple_accounts(addresses)
+        idls = await asyncio.gather(
+            *[asyncio.to_thread(self._decode_idl_account, acc) for acc in accounts],
+            return_exceptions=True,
+        )
+
+        for program_id, idl in zip(missing, idls):
+            if isinstance(idl, Exception):
+                # One malformed IDL account must not fail the rest of the batch
+                logger.warning("Could not decode IDL for %s: %s", program_id, idl)
+                idl = None
+            if idl is not None:
+                self._store_cached_idl((self.rpc_url, program_id), idl)
+            results[program_id] = idl
+
+        return results
+
+    @staticmethod
+    def _decode_idl_account(
+        account: Optional[Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        from anchorpy import Idl
+
+        if not account:
+            return None
+
+        raw = base64.b64decode(account["data"][0])
+        offset = ANCHOR_DISCRIMINATOR_SIZE + IDL_AUTHORITY_SIZE
+        (length,) = struct.unpack_from("<I", raw, offset)
+        offset += 4
+        idl_json = zlib.decompress(raw[offset : offset + length]).decode()
+
+        # Round-trip through anchorpy so the result matches fetch_idl's output
+        return orjson.loads(Idl.from_json(idl_json).to_json())
+
+    async def _fetch_idl_uncached(self, program_id: str) -> Optional[Dict[str, Any]]:
+        from anchorpy.program.core import Program
+
+        provider = self.rpc_client.get_anchor_provider()
+        idl = await Program.fetch_idl(_pubkey_from_string(program_id), provider)
+
+        return orjson.loads(idl.to_json()) if idl else None
 
     async def get_idl_with_fallback(
         self, program_id: str, idl_content: Optional[Dict[str, Any]] = None
@@ -50,83 +278,132 @@ class SolanaIDLLoader(BaseIDLLoader):
             return idl_content
         return await self.fetch_idl(program_id)
 
-    def get_program(self, program_id: str, idl_dict: Dict[str, Any]) -> Program:
+    def get_program(self, program_id: str, idl_dict: Dict[str, Any]) -> "Program":
         """
         Constructs an Anchor Program instance from a provided IDL dictionary.
         """
-        idl = Idl.from_json(json.dumps(idl_dict))
-        client = AsyncClient(self.rpc_url)
-        provider = Provider(client, Wallet.dummy())
-        return Program(idl, Pubkey.from_string(program_id), provider)
-
-    def parse_instructions(self, idl: Dict[str, Any]) -> List[Dict[str, Any]]:
-        instructions = idl.get("instructions", [])
-        parsed = []
-
-        for ix in instructions:
-            name = ix.get("name", "unknown")
-            discriminator = ix.get("discriminator")
-
-            if not discriminator:
-                disc_bytes = compute_discriminator(name)
-                discriminator = list(disc_bytes)
-
-            accounts = []
-            for acc in ix.get("accounts", []):
-                accounts.append(
-                    {
-                        "name": acc.get("name", "unknown"),
-                        "isMut": acc.get("isMut", acc.get("writable", False)),
-                        "isSigner": acc.get("isSigner", acc.get("signer", False)),
-                        "docs": acc.get("docs", []),
-                        "optional": acc.get("optional", acc.get("isOptional", False)),
-                    }
-                )
-
-            args = []
-            for arg in ix.get("args", []):
-                args.append(
-                    {
-                        "name": arg.get("name", "unknown"),
-                        "type": self._serialize_type(arg.get("type")),
-                    }
-                )
-
-            parsed.append(
-                {
-                    "name": name,
-                    "discriminator": discriminator,
-                    "accounts": accounts,
-                    "args": args,
-                    "docs": ix.get("docs", []),
-                }
-            )
+        from anchorpy.program.core import Program
+        from anchorpy import Idl
 
-        return parsed
+        canonical_json = orjson.dumps(idl_dict, option=orjson.OPT_SORT_KEYS)
+        idl_hash = hashlib.blake2b(canonical_json, digest_size=16).hexdigest()
+
+        key = (program_id, idl_hash)
+        program = self._program_cache.get(key)
+        if program is not None:
+            self._program_cache.move_to_end(key)
+            return program
 
-    def parse_types(self, idl: Dict[str, Any]) -> List[Dict[str, Any]]:
-        types = idl.get("types", [])
-        parsed = []
+        idl = self._idl_object_cache.get(idl_hash)
+        if idl is None:
+            idl = Idl.from_json(canonical_json.decode())
+            self._idl_object_cache[idl_hash] = idl
+            while len(self._idl_object_cache) > self.IDL_CACHE_MAX_ENTRIES:
+                self._idl_object_cache.popitem(last=False)
+        else:
+            self._idl_object_cache.move_to_end(idl_hash)
 
-        for t in types:
-            parsed.append({"name": t.get("name", "unknown"), "type": t.get("type")})
+        provider = self.rpc_client.get_anchor_provider()
+        program = Program(idl, _pubkey_from_string(program_id), provider)
+        # The IDL is caller-supplied, so keep only the most recently used programs
+        self._program_cache[key] = program
+        while len(self._program_cache) > self.PROGRAM_CACHE_MAX_ENTRIES:
+            self._program_cache.popitem(last=False)
+        return program
+
+    def parse_all(self, idl: Dict[str, Any]) -> ParsedIDL:
+        """
+        Parses every section of the IDL in a single pass.
+        """
+        parsed = ParsedIDL()
+        compute_discriminators = _needs_discriminator_compute(idl)
+
+        for key, value in idl.items():
+            if key == "instructions":
+                for ix in value:
+                    parsed_ix = self._parse_instruction(ix, compute_discriminators)
+                    parsed.by_name.setdefault(parsed_ix.name, len(parsed.instructions))
+                    parsed.instructions.append(parsed_ix)
+            elif key == "accounts":
+                parsed.accounts = self._parse_account_defs(value)
+            elif key == "types":
+                parsed.types = self._parse_type_defs(value)
+            elif key == "events":
+                parsed.events = value
+            elif key == "errors":
+                parsed.errors = value
 
         return parsed
 
-    def parse_accounts(self, idl: Dict[str, Any]) -> List[Dict[str, Any]]:
-        accounts = idl.get("accounts", [])
-        parsed = []
-
-        for acc in accounts:
-            parsed.append(
-                {
-                    "name": acc.get("name", "unknown"),
-                    "discriminator": acc.get("discriminator"),
-                    "type": acc.get("type"),
-                }
+    def _parse_instruction(
+        self, ix: Dict[str, Any], compute_discriminator_if_missing: bool = True
+    ) -> ParsedInstruction:
+        name = ix.get("name", "unknown")
+        discriminator = ix.get("discriminator")
+
+        if not discriminator and compute_discriminator_if_missing:
+            disc_bytes = compute_discriminator(name)
+            discriminator = list(disc_bytes)
+
+        accounts = [
+            ParsedInstructionAccount(
+                name=acc.get("name", "unknown"),
+                is_mut=acc.get("isMut", acc.get("writable", False)),
+                is_signer=acc.get("isSigner", acc.get("signer", False)),
+                docs=acc.get("docs", []),
+                optional=acc.get("optional", acc.get("isOptional", False)),
             )
+            for acc in ix.get("accounts", [])
+        ]
 
-        return parsed
+        args = [
+            ParsedArg(
+                name=arg.get("name", "unknown"),
+                type=self._serialize_type(arg.get("type")),
+            )
+            for arg in ix.get("args", [])
+        ]
+
+        return ParsedInstruction(
+            name=name,
+            discriminator=discriminator,
+            accounts=accounts,
+            args=args,
+            docs=ix.get("docs", []),
+        )
+
+    @staticmethod
+    def _parse_account_defs(accounts: List[Dict[str, Any]]) -> List[ParsedTypeDef]:
+        return [
+            ParsedTypeDef(
+                name=acc.get("name", "unknown"),
+                type_def=acc.get("type", {}),
+                discriminator=acc.get("discriminator"),
+            )
+            for acc in accounts
+        ]
+
+    @staticmethod
+    def _parse_type_defs(types: List[Dict[str, Any]]) -> List[ParsedTypeDef]:
+        return [
+            ParsedTypeDef(name=t.get("name", "unknown"), type_def=t.get("type", {}))
+            for t in types
+        ]
+
+    # The single-section accessors parse only their own section; use parse_all
+    # when more than one section is needed
+    def parse_instructions(self, idl: Dict[str, Any]) -> List[ParsedInstruction]:
+        compute_discriminators = _needs_discriminator_compute(idl)
+        return [
+            self._parse_instruction(ix, compute_discriminators)
+            for ix in idl.get("instructions", [])
+        ]
+
+    def parse_types(self, idl: Dict[str, Any]) -> List[ParsedTypeDef]:
+        return self._parse_type_defs(idl.get("types", []))
+
+    def parse_accounts(self, idl: Dict[str, Any]) -> List[ParsedTypeDef]:
+        return self._parse_account_defs(idl.get("accounts", []))
 
     def parse_events(self, idl: Dict[str, Any]) -> List[Dict[str, Any]]:
         return idl.get("events", [])
@@ -136,29 +413,28 @@ class SolanaIDLLoader(BaseIDLLoader):
 
     def get_instruction_schema(
         self, idl: Dict[str, Any], instruction_name: str
-    ) -> Optional[Dict[str, Any]]:
-        instructions = self.parse_instructions(idl)
-        for ix in instructions:
-            if ix["name"] == instruction_name:
-                return ix
+    ) -> Optional[ParsedInstruction]:
+        # Only the matching instruction is parsed; the other sections are untouched
+        for ix in idl.get("instructions", []):
+            if ix.get("name", "unknown") == instruction_name:
+                return self._parse_instruction(ix, _needs_discriminator_compute(idl))
         return None
 
     def _serialize_type(self, type_def: Any) -> Any:
-        if isinstance(type_def, str):
-            return type_def
-
-        if isinstance(type_def, dict):
-            if "vec" in type_def:
-                return {"vec": self._serialize_type(type_def["vec"])}
-            if "option" in type_def:
-                return {"option": self._serialize_type(type_def["option"])}
-            if "array" in type_def:
-                arr = type_def["array"]
-                return {"array": [self._serialize_type(arr[0]), arr[1]]}
-            if "defined" in type_def:
-                return {"defined": type_def["defined"]}
-            if "coption" in type_def:
-                return {"coption": self._serialize_type(type_def["coption"])}
-            return type_def
-
-        return str(type_def)
+        # Iterative walk: each frame is (container, slot, type_def) where the
+        # serialized type_def is written to container[slot]
+        root: List[Any] = [None]
+        stack: List[Tuple[Any, Any, Any]] = [(root, 0, type_def)]
+
+        while stack:
+            container, slot, node = stack.pop()
+
+            if isinstance(node, str):
+                container[slot] = node
+            elif isinstance(node, dict):
+                handler = _TYPE_HANDLERS.get(next(iter(node), None))
+                container[slot] = handler(node, stack) if handler else node
+            else:
+                container[slot] = str(node)
+
+        return root[0]
@@ -1,25 +1,89 @@
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
 from ..base.rpc_client import BaseRPCClient
 
+if TYPE_CHECKING:
+    from anchorpy.provider import Provider
+
 
 class SolanaRPCClient(BaseRPCClient):
     DEFAULT_RPC_URL = "https://api.mainnet-beta.solana.com"
+    MAX_MULTIPLE_ACCOUNTS = 100
+
+    _anchor_provider: Optional["Provider"] = None
 
     @classmethod
     def get_default_rpc_url(cls) -> str:
         return cls.DEFAULT_RPC_URL
 
+    def get_anchor_provider(self) -> "Provider":
+        """
+        Returns an Anchor Provider bound to this client's RPC URL, built once and reused.
+        """
+        if self._anchor_provider is None:
+            from solana.rpc.async_api import AsyncClient
+            from anchorpy.provider import Provider, Wallet
+
+            connection = AsyncClient(self.rpc_url, timeout=self.timeout)
+            self._anchor_provider = Provider(connection, Wallet.dummy())
+        return self._anchor_provider
+
+    async def close(self):
+        if self._anchor_provider is not None:
+            await self._anchor_provider.connection.close()
+            self._anchor_provider = None
+        await super().close()
+
     async def _request(
         self, method: str, params: Optional[List[Any]] = None
     ) -> Dict[str, Any]:
         payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or []}
-        response = await self.client.post(self.rpc_url, json=payload)
-        response.raise_for_status()
-        result = response.json()
+        result = await self._post_json(payload)
         if "error" in result:
             raise Exception(f"RPC Error: {result['error']}")
         return result.get("result")
 
+    async def _request_many(
+        self, calls: List[Tuple[str, Optional[List[Any]]]]
+    ) -> List[Any]:
+        """
+        Sends several JSON-RPC calls in one batch request, returning results in order.
+        """
+        if not calls:
+            return []
+
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params or []}
+            for i, (method, params) in enumerate(calls)
+        ]
+        responses = await self._post_json(payload)
+        if isinstance(responses, dict):
+            # The node rejected the batch as a whole
+            raise Exception(f"RPC Error: {responses.get('error', responses)}")
+
+        # Responses may arrive in any order; place each one by its id
+        results: List[Any] = [None] * len(calls)
+        answered = set()
+        for response in responses:
+            if "error" in response:
+                raise Exception(f"RPC Error: {response['error']}")
+            response_id = response.get("id")
+            if (
+                type(response_id) is not int
+                or not 0 <= response_id < len(calls)
+                or response_id in answered
+            ):
+                raise Exception(
+                    f"RPC Error: unexpected batch response id {response_id!r}"
+                )
+            answered.add(response_id)
+            results[response_id] = response.get("result")
+
+        if len(answered) != len(calls):
+            raise Exception(
+                f"RPC Error: batch returned {len(answered)} of {len(calls)} responses"
+            )
+        return results
+
     async def get_account_info(
         self, address: str, encoding: str = "base64", **kwargs
     ) -> Optional[Dict[str, Any]]:
@@ -28,6 +92,28 @@ class SolanaRPCClient(BaseRPCClient):
         )
         return result.get("value") if result else None
 
+    async def get_multiple_accounts(
+        self, addresses: List[str], encoding: str = "base64"
+    ) -> List[Optional[Dict[str, Any]]]:
+        # getMultipleAccounts is capped per call; larger lists go out as one batch
+        chunks = [
+            addresses[i : i + self.MAX_MULTIPLE_ACCOUNTS]
+            for i in range(0, len(addresses), self.MAX_MULTIPLE_ACCOUNTS)
+        ]
+        if len(chunks) <= 1:
+            result = await self._request(
+                "getMultipleAccounts", [addresses, {"encoding": encoding}]
+            )
+            return result["value"]
+
+        results = await self._request_many(
+            [
+                ("getMultipleAccounts", [chunk, {"encoding": encoding}])
+                for chunk in chunks
+            ]
+        )
+        return [account for result in results for account in result["value"]]
+
     async def get_latest_blockhash(self) -> Dict[str, Any]:
         result = await self._request(
             "getLatestBlockhash", [{"commitment": "finalized"}]
@@ -0,0 +1,88 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from ...core.configs import settings
+from .rpc_client import SolanaRPCClient
+from .idl_loader import SolanaIDLLoader
+
+# Public clusters share one long-lived client (and keep-alive connection pool)
+# per URL; operators can pool more via POOLED_RPC_URLS. Any other caller-supplied
+# URL gets a client scoped to its request, so callers cannot grow the pool.
+PUBLIC_RPC_URLS = frozenset(
+    {
+        "https://api.mainnet-beta.solana.com",
+        "https://api.testnet.solana.com",
+        "https://api.devnet.solana.com",
+    }
+)
+
+_rpc_clients: Dict[str, SolanaRPCClient] = {}
+_idl_loaders: Dict[str, SolanaIDLLoader] = {}
+
+
+def _resolve_rpc_url(rpc_url: Optional[str]) -> str:
+    return rpc_url or SolanaRPCClient.get_default_rpc_url()
+
+
+def is_pooled_rpc_url(rpc_url: Optional[str]) -> bool:
+    url = _resolve_rpc_url(rpc_url)
+    return (
+        url in PUBLIC_RPC_URLS
+        or url in settings.POOLED_RPC_URLS
+        or url in settings.BLOCKHASH_PREFETCH_RPC_URLS
+    )
+
+
+def _pooled_rpc_client(rpc_url: str) -> SolanaRPCClient:
+    client = _rpc_clients.get(rpc_url)
+    if client is None:
+        client = _rpc_clients[rpc_url] = SolanaRPCClient(rpc_url)
+    return client
+
+
+def _pooled_idl_loader(rpc_url: str) -> SolanaIDLLoader:
+    loader = _idl_loaders.get(rpc_url)
+    if loader is None:
+        loader = _idl_loaders[rpc_url] = SolanaIDLLoader(_pooled_rpc_client(rpc_url))
+    return loader
+
+
+@asynccontextmanager
+async def acquire_rpc_client(
+    rpc_url: Optional[str] = None,
+) -> AsyncIterator[SolanaRPCClient]:
+    """
+    Yields the pooled client for a known URL, or a throwaway client for any other.
+    """
+    url = _resolve_rpc_url(rpc_url)
+    if is_pooled_rpc_url(url):
+        yield _pooled_rpc_client(url)
+        return
+
+    client = SolanaRPCClient(url)
+    try:
+        yield client
+    finally:
+        await client.close()
+
+
+@asynccontextmanager
+async def acquire_idl_loader(
+    rpc_url: Optional[str] = None,
+) -> AsyncIterator[SolanaIDLLoader]:
+    url = _resolve_rpc_url(rpc_url)
+    if is_pooled_rpc_url(url):
+        yield _pooled_idl_loader(url)
+        return
+
+    async with acquire_rpc_client(url) as client:
+        yield SolanaIDLLoader(client)
+
+
+async def close_rpc_clients() -> None:
+    clients = list(_rpc_clients.values())
+    _rpc_clients.clear()
+    _idl_loaders.clear()
+    await asyncio.gather(
+        *(client.close() for client in clients), return_exceptions=True
+    )
@@ -1,70 +1,75 @@
-import base64
 import base58
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional
 from solders.pubkey import Pubkey
 from solders.hash import Hash
 from solders.message import Message
 from solders.transaction import Transaction
 from solders.instruction import Instruction, AccountMeta as SoldersAccountMeta
 from ..base.tx_builder import BaseTxBuilder
+from ...utils.encoding import decode_hex_or_base64, encode_base64
 
 
 class SolanaTxBuilder(BaseTxBuilder):
     def decode_instruction_data(self, data: str) -> bytes:
-        if data.startswith("0x"):
-            return bytes.fromhex(data[2:])
-
-        try:
-            return bytes.fromhex(data)
-        except ValueError:
-            pass
-
-        try:
-            return base64.b64decode(data)
-        except Exception:
-            pass
-
-        raise ValueError(f"Could not decode instruction data: {data}")
+        return decode_hex_or_base64(data)
 
     def build_instruction(
-        self, program_id: str, accounts: List[Dict[str, Any]], data: bytes
+        self, program_id: str, accounts: Iterable[Any], data: bytes
     ) -> Instruction:
+        """
+        Accounts may be dicts or objects exposing pubkey/is_signer/is_writable,
+        so request models can be passed through without copying.
+        """
         program_pubkey = Pubkey.from_string(program_id)
 
         account_metas = []
         for acc in accounts:
+            if isinstance(acc, dict):
+                pubkey_str = acc.get("pubkey")
+                is_signer = acc.get("is_signer", False)
+                is_writable = acc.get("is_writable", False)
+            else:
+                pubkey_str = acc.pubkey
+                is_signer = acc.is_signer
+                is_writable = acc.is_writable
+
             try:
-                pubkey = Pubkey.from_string(acc["pubkey"])
-            except ValueError as e:
-                raise ValueError(f"Invalid public key '{acc.get('pubkey')}': {str(e)}")
+                pubkey = Pubkey.from_string(pubkey_str)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid public key '{pubkey_str}': {str(e)}")
 
             account_metas.append(
                 SoldersAccountMeta(
-                    pubkey=pubkey,
-                    is_signer=acc.get("is_signer", False),
-                    is_writable=acc.get("is_writable", False),
+                    pubkey=pubkey, is_signer=is_signer, is_writable=is_writable
                 )
             )
 
         return Instruction(program_id=program_pubkey, accounts=account_metas, data=data)
 
-    async def build_transaction(
+    def build_unsigned(
         self, instructions: List[Instruction], fee_payer: str, recent_block: str
-    ) -> Dict[str, Any]:
+    ) -> Transaction:
+        """Build the unsigned transaction without serializing it."""
         fee_payer_pubkey = Pubkey.from_string(fee_payer)
         blockhash = Hash.from_string(recent_block)
 
         message = Message.new_with_blockhash(instructions, fee_payer_pubkey, blockhash)
 
-        tx = Transaction.new_unsigned(message)
+        return Transaction.new_unsigned(message)
+
+    async def build_transaction(
+        self, instructions: List[Instruction], fee_payer: str, recent_block: str
+    ) -> Dict[str, Any]:
+        tx = self.build_unsigned(instructions, fee_payer, recent_block)
+        message = tx.message
 
         return {
             "transaction": tx,
             "message": message,
-            "transaction_base64": base64.b64encode(bytes(tx)).decode("utf-8"),
-            "message_base64": base64.b64encode(bytes(message)).decode("utf-8"),
+            "transaction_base64": encode_base64(bytes(tx)),
+            "message_base64": encode_base64(bytes(message)),
             "blockhash": recent_block,
         }
 
     def serialize_transaction(self, transaction: Transaction) -> str:
-        return base64.b64encode(bytes(transaction)).decode("utf-8")
+        return encode_base64(bytes(transaction))
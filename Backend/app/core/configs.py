@@ -1,7 +1,7 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 from functools import lru_cache
-from typing import Optional
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -12,6 +12,15 @@ class Settings(BaseSettings):
     # Solana
     # Optional because it might not be set in all environments
     BACKEND_SOLANA_KEYPAIR: Optional[str] = None
+    # RPC URLs, besides the public clusters, that get a long-lived pooled client
+    # (JSON list); any other URL gets a client for the duration of its request
+    POOLED_RPC_URLS: List[str] = []
+    # RPC URLs whose latest blockhash is kept warm by a background task (JSON list);
+    # these are pooled as well
+    BLOCKHASH_PREFETCH_RPC_URLS: List[str] = []
+    # Send alongside the pre-send simulation instead of after it. Off by default:
+    # when enabled, a transaction whose simulation fails may still land on-chain.
+    PARALLEL_SIMULATE_SEND: bool = False
 
     # This config tells pydantic to read from a .env file if present
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
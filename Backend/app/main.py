@@ -1,12 +1,29 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from .routers.solana import router as solana_router
 from .models.schemas import SupportedChainsResponse, ChainInfoResponse
 from .chains.registry import ChainRegistry, initialize_registry
+from .chains.solana.rpc_pool import close_rpc_clients
+from .chains.solana.blockhash_cache import (
+    start_blockhash_refreshers,
+    stop_blockhash_refreshers,
+)
+from .core.configs import settings
 
 initialize_registry()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start_blockhash_refreshers(settings.BLOCKHASH_PREFETCH_RPC_URLS)
+    yield
+    await stop_blockhash_refreshers()
+    await close_rpc_clients()
+
+
 app = FastAPI(
     title="Multi-Chain Postman Backend",
     description="""
@@ -26,6 +43,8 @@ extensible architecture for adding other chains.
     version="2.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -36,6 +55,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# IDL payloads (raw_idl especially) are large and compress well
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 app.include_router(solana_router)
 
 
@@ -53,7 +75,7 @@ async def global_exception_handler(request: Request, exc: Exception):
         if parts and ChainRegistry.is_chain_supported(parts[0]):
             chain = parts[0]
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"error": "Internal Server Error", "detail": str(exc), "chain": chain},
     )
@@ -68,6 +90,7 @@ async def root():
     for chain in supported_chains:
         endpoints[chain] = {
             "idl": {
+                f"GET /{chain}/idl?program_ids=...": "Fetch IDLs for several programs at once",
                 f"GET /{chain}/idl/{{program_id}}": "Fetch IDL for a program",
                 f"GET /{chain}/idl/{{program_id}}/methods": "Get instruction methods from IDL",
             },
@@ -99,8 +122,15 @@ async def health_check():
     return {"status": "healthy"}
 
 
-@app.get("/chains", response_model=SupportedChainsResponse, tags=["Info"])
-async def get_supported_chains():
+# The payload is built from trusted registry data, so it is returned unvalidated;
+# `responses` keeps the documented schema without a response_model
+@app.get(
+    "/chains",
+    response_model=None,
+    responses={200: {"model": SupportedChainsResponse}},
+    tags=["Info"],
+)
+async def get_supported_chains() -> SupportedChainsResponse:
     chains = []
     for chain_id in ChainRegistry.get_supported_chains():
         config = ChainRegistry.get_chain_config(chain_id)
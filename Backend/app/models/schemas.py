@@ -1,6 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Any, Dict
+from typing_extensions import TypedDict
 from enum import Enum
+from functools import cached_property
+from ..utils.encoding import decode_hex, decode_hex_or_base64
 
 
 class ChainType(str, Enum):
@@ -28,65 +31,78 @@ class DataType(str, Enum):
     BYTES = "bytes"
 
 
-class LayoutField(BaseModel):
+class _FrozenModel(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+class LayoutField(_FrozenModel):
     type: DataType
     value: Any
 
 
-class PackInstructionRequest(BaseModel):
+class PackInstructionRequest(_FrozenModel):
     layout: List[LayoutField]
 
 
-class PackInstructionResponse(BaseModel):
+class PackInstructionResponse(_FrozenModel):
     chain: str
     buffer_hex: str
     buffer_base64: str
     length: int
 
 
-class UnpackInstructionRequest(BaseModel):
+class UnpackInstructionRequest(_FrozenModel):
     buffer_hex: str
     layout: List[LayoutField]
 
+    # Decoded on first use and cached; a bad buffer raises ValueError in the handler
+    @cached_property
+    def buffer_bytes(self) -> bytes:
+        return decode_hex(self.buffer_hex)
+
 
-class UnpackInstructionResponse(BaseModel):
+class UnpackInstructionResponse(_FrozenModel):
     chain: str
     values: List[Any]
 
 
-class AccountMeta(BaseModel):
+class AccountMeta(_FrozenModel):
     pubkey: str
     is_signer: bool = False
     is_writable: bool = False
 
 
-class AdditionalSigner(BaseModel):
+class AdditionalSigner(_FrozenModel):
     name: str
     secret_key: List[int]
 
 
-class BuildTransactionRequest(BaseModel):
+class BuildTransactionRequest(_FrozenModel):
     rpc_url: Optional[str] = None
     program_id: str
     accounts: List[AccountMeta]
     instruction_data: str = Field(description="Hex or base64 encoded instruction data")
     fee_payer: Optional[str] = None
 
+    @cached_property
+    def instruction_bytes(self) -> bytes:
+        return decode_hex_or_base64(self.instruction_data)
 
-class BuildTransactionResponse(BaseModel):
+
+class BuildTransactionResponse(_FrozenModel):
     chain: str
     transaction_base64: str
     message_base64: str
     blockhash: str
 
 
-class SimulateTransactionRequest(BaseModel):
+class SimulateTransactionRequest(_FrozenModel):
     rpc_url: Optional[str] = None
     transaction_base64: str
     encoding: str = Field(default="base64")
 
 
-class SimulateTransactionResponse(BaseModel):
+class SimulateTransactionResponse(_FrozenModel):
     chain: str
     success: bool
     logs: List[str]
@@ -95,7 +111,7 @@ class SimulateTransactionResponse(BaseModel):
     return_data: Optional[Dict[str, Any]] = None
 
 
-class SendTransactionRequest(BaseModel):
+class SendTransactionRequest(_FrozenModel):
     rpc_url: Optional[str] = "https://api.testnet.solana.com"
     transaction_base64: Optional[str] = None
     program_id: Optional[str] = None
@@ -108,9 +124,20 @@ class SendTransactionRequest(BaseModel):
         default=False, description="Sign and send with backend keypair (testnet only)"
     )
     additional_signers: Optional[List[AdditionalSigner]] = None
+    skip_presend_simulation: bool = Field(
+        default=False,
+        description="Skip the pre-send simulation, e.g. when already run via /simulate",
+    )
 
+    # Only read on the backend-signing path, where instruction_data is used
+    @cached_property
+    def instruction_bytes(self) -> Optional[bytes]:
+        if not self.instruction_data:
+            return None
+        return decode_hex_or_base64(self.instruction_data)
 
-class SendTransactionResponse(BaseModel):
+
+class SendTransactionResponse(_FrozenModel):
     chain: str
     signature: str
     success: bool
@@ -119,19 +146,21 @@ class SendTransactionResponse(BaseModel):
     return_data: Optional[Dict[str, Any]] = None
 
 
-class IDLInstruction(BaseModel):
+class IDLInstruction(_FrozenModel):
     name: str
     discriminator: Optional[List[int]] = None
     accounts: List[Dict[str, Any]]
     args: List[Dict[str, Any]]
+    docs: List[str] = []
 
 
-class IDLType(BaseModel):
+class IDLType(_FrozenModel):
     name: str
     type_def: Dict[str, Any]
+    discriminator: Optional[List[int]] = None
 
 
-class IDLResponse(BaseModel):
+class IDLResponse(_FrozenModel):
     chain: str
     program_id: str
     version: Optional[str] = None
@@ -144,26 +173,32 @@ class IDLResponse(BaseModel):
     raw_idl: Dict[str, Any]
 
 
-class IDLMethodsResponse(BaseModel):
+class IDLBatchResponse(_FrozenModel):
+    chain: str
+    idls: List[IDLResponse]
+    not_found: List[str]
+
+
+class IDLMethodsResponse(_FrozenModel):
     chain: str
     program_id: str
     methods: List[IDLInstruction]
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(_FrozenModel):
     error: str
     detail: Optional[str] = None
     code: Optional[str] = None
     chain: Optional[str] = None
 
 
-class AccountInfoRequest(BaseModel):
+class AccountInfoRequest(_FrozenModel):
     rpc_url: Optional[str] = None
     pubkey: str
     encoding: str = Field(default="base64")
 
 
-class AccountInfoResponse(BaseModel):
+class AccountInfoResponse(_FrozenModel):
     chain: str
     pubkey: str
     lamports: int
@@ -174,7 +209,7 @@ class AccountInfoResponse(BaseModel):
     data_len: int
 
 
-class ChainInfoResponse(BaseModel):
+class ChainInfoResponse(TypedDict):
     chain: str
     name: str
     default_rpc_url: str
@@ -182,5 +217,5 @@ class ChainInfoResponse(BaseModel):
     data_types: List[str]
 
 
-class SupportedChainsResponse(BaseModel):
+class SupportedChainsResponse(TypedDict):
     chains: List[ChainInfoResponse]
@@ -1,24 +1,106 @@
-from fastapi import APIRouter, HTTPException, Query
-from ...chains.solana import SolanaRPCClient, SolanaIDLLoader
-from ...models.schemas import IDLResponse, IDLMethodsResponse, ErrorResponse
+from fastapi import APIRouter, Depends, HTTPException, Query
+from ...chains.solana import SolanaIDLLoader
+from ...chains.solana.idl_loader import ParsedIDL
+from ...chains.solana.rpc_pool import acquire_idl_loader
+from ...utils.responses import MsgspecResponse
+from ...models.schemas import (
+    IDLResponse,
+    IDLBatchResponse,
+    IDLMethodsResponse,
+    ErrorResponse,
+)
+from typing import Any, AsyncIterator, Dict
 
 router = APIRouter(prefix="/idl", tags=["Solana - IDL"])
 
+# getMultipleAccounts accepts at most 100 addresses per call
+MAX_BATCH_PROGRAM_IDS = 100
+
+
+async def _idl_loader(
+    rpc_url: str = Query(default=None, description="Solana RPC URL (defaults to mainnet)")
+) -> AsyncIterator[SolanaIDLLoader]:
+    async with acquire_idl_loader(rpc_url) as idl_loader:
+        yield idl_loader
+
+
+def _idl_response_body(
+    program_id: str, idl: Dict[str, Any], parsed: ParsedIDL
+) -> Dict[str, Any]:
+    # Shaped like IDLResponse; encoded straight from the parsed structs by msgspec
+    return {
+        "chain": "solana",
+        "program_id": program_id,
+        "version": idl.get("version"),
+        "name": idl.get("name"),
+        "instructions": parsed.instructions,
+        "accounts": parsed.accounts,
+        "types": parsed.types,
+        "events": parsed.events,
+        "errors": parsed.errors,
+        "raw_idl": idl,
+    }
+
+
+@router.get(
+    "",
+    response_model=IDLBatchResponse,
+    response_class=MsgspecResponse,
+    responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
+    summary="Fetch Multiple Anchor IDLs",
+    description="Fetch and parse the Anchor IDLs for several Solana programs in one RPC round-trip"
+)
+async def get_idls(
+    program_ids: str = Query(description="Comma-separated list of program IDs"),
+    idl_loader: SolanaIDLLoader = Depends(_idl_loader)
+):
+    ids = list(dict.fromkeys(pid.strip() for pid in program_ids.split(",") if pid.strip()))
+    if not ids:
+        raise HTTPException(status_code=400, detail="program_ids must not be empty")
+    if len(ids) > MAX_BATCH_PROGRAM_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_PROGRAM_IDS} program_ids can be fetched at once"
+        )
+
+    try:
+        idls = await idl_loader.fetch_idls(ids)
+        
+        return MsgspecResponse(
+            {
+                "chain": "solana",
+                "idls": [
+                    _idl_response_body(program_id, idl, idl_loader.parse_all(idl))
+                    for program_id, idl in idls.items()
+                    if idl
+                ],
+                "not_found": [
+                    program_id for program_id, idl in idls.items() if not idl
+                ],
+            }
+        )
+    
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error fetching IDLs: {str(e)}"
+        )
+
 
 @router.get(
     "/{program_id}",
     response_model=IDLResponse,
+    response_class=MsgspecResponse,
     responses={404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
     summary="Fetch Anchor IDL",
     description="Fetch and parse the Anchor IDL for a Solana program"
 )
 async def get_idl(
     program_id: str,
-    rpc_url: str = Query(default=None, description="Solana RPC URL (defaults to mainnet)")
+    idl_loader: SolanaIDLLoader = Depends(_idl_loader)
 ):
-    rpc_client = SolanaRPCClient(rpc_url)
-    idl_loader = SolanaIDLLoader(rpc_client)
-    
     try:
         idl = await idl_loader.fetch_idl(program_id)
         
@@ -28,37 +110,8 @@ async def get_idl(
                 detail=f"No Anchor IDL found for program {program_id}"
             )
         
-        instructions = idl_loader.parse_instructions(idl)
-        accounts = idl_loader.parse_accounts(idl)
-        types = idl_loader.parse_types(idl)
-        events = idl_loader.parse_events(idl)
-        errors = idl_loader.parse_errors(idl)
-        
-        return IDLResponse(
-            chain="solana",
-            program_id=program_id,
-            version=idl.get("version"),
-            name=idl.get("name"),
-            instructions=[
-                {
-                    "name": ix["name"],
-                    "discriminator": ix.get("discriminator"),
-                    "accounts": ix["accounts"],
-                    "args": ix["args"]
-                }
-                for ix in instructions
-            ],
-            accounts=[
-                {"name": acc["name"], "type_def": acc.get("type", {})}
-                for acc in accounts
-            ],
-            types=[
-                {"name": t["name"], "type_def": t.get("type", {})}
-                for t in types
-            ],
-            events=events,
-            errors=errors,
-            raw_idl=idl
+        return MsgspecResponse(
+            _idl_response_body(program_id, idl, idl_loader.parse_all(idl))
         )
     
     except HTTPException:
@@ -68,24 +121,20 @@ async def get_idl(
             status_code=500,
             detail=f"Error fetching IDL: {str(e)}"
         )
-    finally:
-        await rpc_client.close()
 
 
 @router.get(
     "/{program_id}/methods",
     response_model=IDLMethodsResponse,
+    response_class=MsgspecResponse,
     responses={404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
     summary="Get IDL Methods",
     description="Get list of instruction methods and their argument schemas from a Solana program's IDL"
 )
 async def get_idl_methods(
     program_id: str,
-    rpc_url: str = Query(default=None, description="Solana RPC URL (defaults to mainnet)")
+    idl_loader: SolanaIDLLoader = Depends(_idl_loader)
 ):
-    rpc_client = SolanaRPCClient(rpc_url)
-    idl_loader = SolanaIDLLoader(rpc_client)
-    
     try:
         idl = await idl_loader.fetch_idl(program_id)
         
@@ -95,20 +144,12 @@ async def get_idl_methods(
                 detail=f"No Anchor IDL found for program {program_id}"
             )
         
-        instructions = idl_loader.parse_instructions(idl)
-        
-        return IDLMethodsResponse(
-            chain="solana",
-            program_id=program_id,
-            methods=[
-                {
-                    "name": ix["name"],
-                    "discriminator": ix.get("discriminator"),
-                    "accounts": ix["accounts"],
-                    "args": ix["args"]
-                }
-                for ix in instructions
-            ]
+        return MsgspecResponse(
+            {
+                "chain": "solana",
+                "program_id": program_id,
+                "methods": idl_loader.parse_all(idl).instructions,
+            }
         )
     
     except HTTPException:
@@ -118,5 +159,3 @@ async def get_idl_methods(
             status_code=500,
             detail=f"Error fetching IDL methods, ensure program_id/network is correct: and idl is enambled/deployed {str(e)}"
         )
-    finally:
-        await rpc_client.close()
@@ -50,7 +50,7 @@ async def pack_instruction(request: PackInstructionRequest):
 async def unpack_instruction(request: UnpackInstructionRequest):
     try:
         packer = SolanaBytePacker()
-        data = bytes.fromhex(request.buffer_hex)
+        data = request.buffer_bytes
         layout = [{"type": f.type.value} for f in request.layout]
         unpacked_values = packer.unpack_layout(layout, data)
 
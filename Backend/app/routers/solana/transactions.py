@@ -1,5 +1,7 @@
 from fastapi import APIRouter, HTTPException
 from ...chains.solana import SolanaRPCClient, SolanaTxBuilder
+from ...chains.solana.blockhash_cache import get_blockhash
+from ...chains.solana.rpc_pool import acquire_rpc_client
 from ...models.schemas import (
     BuildTransactionRequest,
     BuildTransactionResponse,
@@ -7,14 +9,18 @@ from ...models.schemas import (
     SimulateTransactionResponse,
     SendTransactionRequest,
     SendTransactionResponse,
+    AdditionalSigner,
     ErrorResponse,
 )
 import os
-import base64
+import asyncio
 import logging
 import json
 import re
-from typing import Any, Dict, List, Optional
+import based58
+import orjson
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from solders.keypair import Keypair
 from ...core.configs import settings
 
@@ -22,34 +28,56 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/tx", tags=["Solana - Transactions"])
 
+# The builder is stateless, so one instance serves every request
+_TX_BUILDER = SolanaTxBuilder()
 
-def _extract_contract_error_message(logs: List[str]) -> Optional[str]:
-    patterns = [
-        re.compile(r"Error Message:\s*(.+)", re.IGNORECASE),
-        re.compile(r"Program log:\s*Error:\s*(.+)", re.IGNORECASE),
-        re.compile(r"Contract reported:\s*(.+)", re.IGNORECASE),
-    ]
 
-    for log in logs:
-        for pattern in patterns:
-            match = pattern.search(log)
-            if match:
-                return match.group(1).strip()
-    return None
+_TESTNET_RPC_URLS = frozenset(
+    {
+        "https://api.testnet.solana.com",
+        "https://api.devnet.solana.com",
+    }
+)
+
+_PUBKEY_RE = re.compile(r"^[1-9A-HJ-NP-Za-km-z]{32,44}$")
+
 
+def _normalize_rpc(url: Optional[str]) -> str:
+    return (url or "").rstrip("/").lower()
 
-def _extract_contract_error_code(logs: List[str]) -> Optional[str]:
-    code_pattern = re.compile(r"Error Code:\s*([A-Za-z0-9_]+)", re.IGNORECASE)
-    number_pattern = re.compile(r"Error Number:\s*(\d+)", re.IGNORECASE)
 
+_ERROR_MESSAGE_PATTERN = re.compile(
+    r"(?:Error Message|Program log:\s*Error|Contract reported):\s*(.+)", re.IGNORECASE
+)
+_ERROR_CODE_PATTERN = re.compile(r"Error Code:\s*([A-Za-z0-9_]+)", re.IGNORECASE)
+_ERROR_NUMBER_PATTERN = re.compile(r"Error Number:\s*(\d+)", re.IGNORECASE)
+
+# Classifies RPC send failures; a signature failure wins over a simulation one
+_SEND_ERROR_PATTERN = re.compile(
+    r"(?P<signature>Signature verification failed"
+    r"|Transaction signature verification failure)"
+    r"|(?P<simulation>Simulation failed|InstructionError"
+    r"|Transaction simulation failed)"
+)
+
+
+def _extract_contract_error(logs: List[str]) -> Tuple[Optional[str], Optional[str]]:
+    """Return the first contract error message and code found in the logs."""
+    message = None
+    code = None
+    # Single pass; each marker stops being searched for once it has been found
     for log in logs:
-        match = code_pattern.search(log)
-        if match:
-            return match.group(1)
-        match = number_pattern.search(log)
-        if match:
-            return match.group(1)
-    return None
+        if message is None:
+            match = _ERROR_MESSAGE_PATTERN.search(log)
+            if match:
+                message = match.group(1).strip()
+        if code is None:
+            match = _ERROR_CODE_PATTERN.search(log) or _ERROR_NUMBER_PATTERN.search(log)
+            if match:
+                code = match.group(1)
+        if message is not None and code is not None:
+            break
+    return message, code
 
 
 def _build_error_detail(
@@ -59,6 +87,7 @@ def _build_error_detail(
     reason: Optional[str] = None,
     code: Optional[str] = None,
     program_error: Optional[Any] = None,
+    signature: Optional[str] = None,
 ):
     detail: Dict[str, Any] = {"message": message}
     if reason:
@@ -70,14 +99,27 @@ def _build_error_detail(
         detail["code"] = code
     if program_error is not None:
         detail["program_error"] = program_error
+    if signature:
+        detail["signature"] = signature
     return detail
 
 
-def get_backend_keypair() -> Keypair:
-    """Load the backend keypair from environment variables."""
+async def _cancel_task(task: asyncio.Task) -> Optional[Any]:
+    """
+    Cancel a task and retrieve its outcome so no exception goes unobserved.
+    Returns the task's result if it had already completed successfully.
+    """
+    task.cancel()
+    (outcome,) = await asyncio.gather(task, return_exceptions=True)
+    return None if isinstance(outcome, BaseException) else outcome
+
+
+@lru_cache(maxsize=1)
+def _load_backend_keypair() -> Tuple[Optional[Keypair], Optional[str]]:
+    """Parse the backend keypair once; a failure is cached as its error message."""
     backend_keypair_env = settings.BACKEND_SOLANA_KEYPAIR
     if not backend_keypair_env:
-        raise ValueError("BACKEND_SOLANA_KEYPAIR environment variable is not set")
+        return None, "BACKEND_SOLANA_KEYPAIR environment variable is not set"
 
     try:
         # Check if the key is a JSON array (byte list) or a Base58 string
@@ -85,12 +127,42 @@ def get_backend_keypair() -> Keypair:
         if key_str.startswith("["):
             # It's a JSON array of bytes
             key_bytes = json.loads(key_str)
-            return Keypair.from_bytes(key_bytes)
+            return Keypair.from_bytes(key_bytes), None
         else:
             # Assume it's a Base58 string
-            return Keypair.from_base58_string(key_str)
+            key_bytes = based58.b58decode(key_str.encode())
+            if len(key_bytes) != 64:
+                raise ValueError(f"expected 64 bytes, got {len(key_bytes)}")
+            return Keypair.from_bytes(key_bytes), None
     except Exception as e:
-        raise ValueError(f"Invalid backend keypair: {str(e)}")
+        return None, f"Invalid backend keypair: {str(e)}"
+
+
+def get_backend_keypair() -> Keypair:
+    """Load the backend keypair from environment variables."""
+    keypair, error = _load_backend_keypair()
+    if error:
+        raise ValueError(error)
+    return keypair
+
+
+def _load_additional_signers(signers: List[AdditionalSigner]) -> List[Keypair]:
+    """Build the extra signers' keypairs, naming the first one that is invalid."""
+    keypairs = []
+    for signer in signers:
+        try:
+            if not signer.secret_key:
+                raise ValueError("Missing secret key bytes")
+            keypair = Keypair.from_bytes(bytes(signer.secret_key))
+        except Exception as e:
+            raise ValueError(
+                f"Invalid additional signer {signer.name}: {str(e)}"
+            ) from e
+        logger.info(
+            "Loaded additional signer '%s' -> %s", signer.name, keypair.pubkey()
+        )
+        keypairs.append(keypair)
+    return keypairs
 
 
 @router.get(
@@ -114,36 +186,27 @@ async def get_backend_wallet():
     description="Build an unsigned Solana transaction",
 )
 async def build_transaction(request: BuildTransactionRequest):
-    rpc_client = SolanaRPCClient(request.rpc_url)
-    tx_builder = SolanaTxBuilder()
-
     try:
-        blockhash_response = await rpc_client.get_latest_blockhash()
-        blockhash = blockhash_response["blockhash"]
-
-        instruction_bytes = tx_builder.decode_instruction_data(request.instruction_data)
-
-        accounts = [
-            {
-                "pubkey": acc.pubkey,
-                "is_signer": acc.is_signer,
-                "is_writable": acc.is_writable,
-            }
-            for acc in request.accounts
-        ]
-
-        instruction = tx_builder.build_instruction(
-            request.program_id, accounts, instruction_bytes
-        )
-
         fee_payer = request.fee_payer
-        if not fee_payer and request.accounts:
+        if not fee_payer:
+            if not request.accounts:
+                raise ValueError("No fee payer specified and no accounts provided")
             fee_payer = request.accounts[0].pubkey
+        # Reject a malformed fee payer before spending an RPC round trip
+        if not _PUBKEY_RE.match(fee_payer):
+            raise ValueError(f"Invalid fee payer public key '{fee_payer}'")
 
-        if not fee_payer:
-            raise ValueError("No fee payer specified and no accounts provided")
+        blockhash = await get_blockhash(request.rpc_url)
 
-        result = await tx_builder.build_transaction([instruction], fee_payer, blockhash)
+        instruction_bytes = request.instruction_bytes
+
+        instruction = _TX_BUILDER.build_instruction(
+            request.program_id, request.accounts, instruction_bytes
+        )
+
+        result = await _TX_BUILDER.build_transaction(
+            [instruction], fee_payer, blockhash
+        )
 
         return BuildTransactionResponse(
             chain="solana",
@@ -158,8 +221,6 @@ async def build_transaction(request: BuildTransactionRequest):
         raise HTTPException(
             status_code=500, detail=f"Error building transaction: {str(e)}"
         )
-    finally:
-        await rpc_client.close()
 
 
 @router.post(
@@ -170,37 +231,36 @@ async def build_transaction(request: BuildTransactionRequest):
     description="Simulate a Solana transaction and get execution logs",
 )
 async def simulate_transaction(request: SimulateTransactionRequest):
-    rpc_client = SolanaRPCClient(request.rpc_url)
-
-    try:
-        result = await rpc_client.simulate_transaction(
-            request.transaction_base64, request.encoding
-        )
-
-        error = result.get("err")
-        logs = result.get("logs", [])
-        units_consumed = result.get("unitsConsumed")
-        return_data = result.get("returnData")
-
-        error_str = None
-        if error:
-            error_str = str(error) if isinstance(error, dict) else str(error)
+    async with acquire_rpc_client(request.rpc_url) as rpc_client:
+        try:
+            result = await rpc_client.simulate_transaction(
+                request.transaction_base64, request.encoding
+            )
 
-        return SimulateTransactionResponse(
-            chain="solana",
-            success=error is None,
-            logs=logs or [],
-            error=error_str,
-            units_consumed=units_consumed,
-            return_data=return_data,
-        )
+            error = result.get("err")
+            logs = result.get("logs", [])
+            units_consumed = result.get("unitsConsumed")
+            return_data = result.get("returnData")
+
+            # Structured errors are returned as JSON so clients can parse them back
+            if isinstance(error, dict):
+                error_str = orjson.dumps(error).decode()
+            else:
+                error_str = str(error) if error else None
+
+            return SimulateTransactionResponse(
+                chain="solana",
+                success=error is None,
+                logs=logs or [],
+                error=error_str,
+                units_consumed=units_consumed,
+                return_data=return_data,
+            )
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error simulating transaction: {str(e)}"
-        )
-    finally:
-        await rpc_client.close()
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Error simulating transaction: {str(e)}"
+            )
 
 
 @router.post(
@@ -211,13 +271,17 @@ async def simulate_transaction(request: SimulateTransactionRequest):
     description="Send a signed transaction to the Solana network",
 )
 async def send_transaction(request: SendTransactionRequest):
+    # One client serves the blockhash fetch, the simulation and the send
+    async with acquire_rpc_client(request.rpc_url) as rpc_client:
+        return await _send_transaction(request, rpc_client)
+
+
+async def _send_transaction(
+    request: SendTransactionRequest, rpc_client: SolanaRPCClient
+) -> SendTransactionResponse:
     if request.sign_with_backend:
         # Only allow on testnet
-        testnet_urls = [
-            "https://api.testnet.solana.com",
-            "https://api.devnet.solana.com",
-        ]
-        if request.rpc_url not in testnet_urls:
+        if _normalize_rpc(request.rpc_url) not in _TESTNET_RPC_URLS:
             raise HTTPException(
                 status_code=400,
                 detail="Backend signing is only allowed on testnet/devnet",
@@ -234,88 +298,72 @@ async def send_transaction(request: SendTransactionRequest):
         # Load backend keypair
         try:
             backend_keypair = get_backend_keypair()
-            logger.info(
-                f"Loaded backend keypair for public key: {backend_keypair.pubkey()}"
-            )
+            # Deriving the pubkey is an ed25519 scalar mult; do it once per request
+            backend_pubkey_str = str(backend_keypair.pubkey())
+            logger.info("Loaded backend keypair for public key: %s", backend_pubkey_str)
         except ValueError as e:
             logger.error(f"Backend keypair error: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
         additional_keypairs = []
         if request.additional_signers:
-            for signer in request.additional_signers:
-                try:
-                    if not signer.secret_key:
-                        raise ValueError("Missing secret key bytes")
-                    kp = Keypair.from_bytes(bytes(signer.secret_key))
-                    additional_keypairs.append(kp)
-                    logger.info(
-                        f"Loaded additional signer '{signer.name}' -> {kp.pubkey()}"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Invalid additional signer {signer.name}: {str(e)}",
-                        exc_info=True,
-                    )
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Invalid additional signer {signer.name}: {str(e)}",
-                    )
-
-        rpc_client = SolanaRPCClient(request.rpc_url)
-        tx_builder = SolanaTxBuilder()
+            try:
+                additional_keypairs = await asyncio.to_thread(
+                    _load_additional_signers, request.additional_signers
+                )
+            except ValueError as e:
+                logger.error("%s", e, exc_info=True)
+                raise HTTPException(status_code=400, detail=str(e))
 
         try:
-            # Build transaction
+            fee_payer = request.fee_payer or backend_pubkey_str
+            # Reject a malformed fee payer before spending an RPC round trip
+            if not _PUBKEY_RE.match(fee_payer):
+                raise ValueError(f"Invalid fee payer public key '{fee_payer}'")
+
+            # Build transaction. The blockhash must be fresh: signing is
+            # deterministic, so a reused one would make a repeated call produce a
+            # byte-identical transaction that the cluster drops as a duplicate.
             blockhash_response = await rpc_client.get_latest_blockhash()
             blockhash = blockhash_response["blockhash"]
 
-            instruction_bytes = tx_builder.decode_instruction_data(
-                request.instruction_data
-            )
-
-            accounts = [
-                {
-                    "pubkey": acc.pubkey,
-                    "is_signer": acc.is_signer,
-                    "is_writable": acc.is_writable,
-                }
-                for acc in accounts_payload
-            ]
+            instruction_bytes = request.instruction_bytes
 
             logger.info(
-                f"Building instruction for program {request.program_id} with accounts: {json.dumps(accounts)}"
+                "Building instruction for program %s with accounts: %s",
+                request.program_id,
+                accounts_payload,
             )
 
-            instruction = tx_builder.build_instruction(
-                request.program_id, accounts, instruction_bytes
+            instruction = _TX_BUILDER.build_instruction(
+                request.program_id, accounts_payload, instruction_bytes
             )
 
-            fee_payer = request.fee_payer or str(backend_keypair.pubkey())
-
-            # Build unsigned
-            unsigned_result = await tx_builder.build_transaction(
+            # Build unsigned; it is serialized only once, after signing
+            unsigned_tx = _TX_BUILDER.build_unsigned(
                 [instruction], fee_payer, blockhash
             )
 
             # Sign with backend + any additional signers
-            unsigned_tx = unsigned_result["transaction"]
             try:
                 # Use partial_sign to allow for cases where backend is one of multiple signers
                 # (though sending will fail if others are missing)
                 signers = [backend_keypair] + additional_keypairs
-                unsigned_tx.partial_sign(signers, unsigned_tx.message.recent_blockhash)
+                # ed25519 signing runs in native code; keep it off the event loop
+                await asyncio.to_thread(
+                    unsigned_tx.partial_sign,
+                    signers,
+                    unsigned_tx.message.recent_blockhash,
+                )
             except ValueError as e:
                 if "keypair-pubkey mismatch" in str(e):
                     raise HTTPException(
                         status_code=400,
-                        detail=f"Backend wallet {backend_keypair.pubkey()} is not a required signer for this transaction. Please ensure the backend wallet is set as a signer or fee payer.",
+                        detail=f"Backend wallet {backend_pubkey_str} is not a required signer for this transaction. Please ensure the backend wallet is set as a signer or fee payer.",
                     )
                 raise e
 
-            signed_transaction_base64 = base64.b64encode(bytes(unsigned_tx)).decode(
-                "utf-8"
-            )
+            signed_transaction_base64 = _TX_BUILDER.serialize_transaction(unsigned_tx)
 
         except HTTPException:
             raise
@@ -325,7 +373,6 @@ async def send_transaction(request: SendTransactionRequest):
                 status_code=400, detail=f"Invalid transaction data: {str(e)}"
             )
         except Exception as e:
-            print(f"DEBUG: Build/Sign Error: {e}")
             logger.error(f"Error building/signing transaction: {str(e)}", exc_info=True)
             raise HTTPException(
                 status_code=500, detail=f"Error processing transaction: {str(e)}"
@@ -339,22 +386,29 @@ async def send_transaction(request: SendTransactionRequest):
             )
 
         signed_transaction_base64 = request.transaction_base64
-        rpc_client = SolanaRPCClient(request.rpc_url)
 
     simulation_logs = []
     simulation_return_data = None
 
     try:
+        send_task = None
         simulation_result = None
-        try:
-            simulation_result = await rpc_client.simulate_transaction(
-                signed_transaction_base64
-            )
-        except Exception as sim_err:
-            logger.warning(
-                f"Unable to simulate transaction before send: {str(sim_err)}",
-                exc_info=True,
-            )
+        if not request.skip_presend_simulation:
+            if settings.PARALLEL_SIMULATE_SEND:
+                # Simulation is only diagnostic here, so the send need not wait
+                send_task = asyncio.create_task(
+                    rpc_client.send_transaction(signed_transaction_base64)
+                )
+
+            try:
+                simulation_result = await rpc_client.simulate_transaction(
+                    signed_transaction_base64
+                )
+            except Exception as sim_err:
+                logger.warning(
+                    f"Unable to simulate transaction before send: {str(sim_err)}",
+                    exc_info=True,
+                )
 
         if simulation_result:
             simulation_logs = simulation_result.get("logs") or []
@@ -367,8 +421,14 @@ async def send_transaction(request: SendTransactionRequest):
                     simulation_error,
                     simulation_logs,
                 )
-                friendly_error = _extract_contract_error_message(simulation_logs)
-                error_code = _extract_contract_error_code(simulation_logs)
+                sent_signature = await _cancel_task(send_task) if send_task else None
+                if sent_signature:
+                    # Too late to cancel: report it so the caller can track it
+                    logger.warning(
+                        "Transaction %s was sent before its simulation failed",
+                        sent_signature,
+                    )
+                friendly_error, error_code = _extract_contract_error(simulation_logs)
                 raise HTTPException(
                     status_code=400,
                     detail=_build_error_detail(
@@ -377,10 +437,14 @@ async def send_transaction(request: SendTransactionRequest):
                         reason=friendly_error,
                         code=error_code,
                         program_error=simulation_error,
+                        signature=sent_signature,
                     ),
                 )
 
-        result = await rpc_client.send_transaction(signed_transaction_base64)
+        if send_task:
+            result = await send_task
+        else:
+            result = await rpc_client.send_transaction(signed_transaction_base64)
 
         return SendTransactionResponse(
             chain="solana",
@@ -394,12 +458,12 @@ async def send_transaction(request: SendTransactionRequest):
         raise
     except Exception as e:
         error_msg = str(e)
-        print(f"DEBUG: Transaction Send Error: {error_msg}")
+        logger.debug("Transaction Send Error: %s", error_msg)
+        error_kinds = {
+            match.lastgroup for match in _SEND_ERROR_PATTERN.finditer(error_msg)
+        }
 
-        if (
-            "Signature verification failed" in error_msg
-            or "Transaction signature verification failure" in error_msg
-        ):
+        if "signature" in error_kinds:
             raise HTTPException(
                 status_code=400,
                 detail=_build_error_detail(
@@ -409,11 +473,7 @@ async def send_transaction(request: SendTransactionRequest):
                 ),
             )
 
-        if (
-            "Simulation failed" in error_msg
-            or "InstructionError" in error_msg
-            or "Transaction simulation failed" in error_msg
-        ):
+        if "simulation" in error_kinds:
             raise HTTPException(
                 status_code=400,
                 detail=_build_error_detail(
@@ -431,5 +491,3 @@ async def send_transaction(request: SendTransactionRequest):
                 reason=error_msg,
             ),
         )
-    finally:
-        await rpc_client.close()
@@ -0,0 +1,29 @@
+import pybase64
+
+
+def decode_hex(data: str) -> bytes:
+    if data.startswith("0x"):
+        data = data[2:]
+    return bytes.fromhex(data)
+
+
+def decode_hex_or_base64(data: str) -> bytes:
+    if data.startswith("0x"):
+        return bytes.fromhex(data[2:])
+
+    try:
+        return bytes.fromhex(data)
+    except ValueError:
+        pass
+
+    try:
+        return pybase64.b64decode(data)
+    except Exception:
+        pass
+
+    raise ValueError(f"Could not decode instruction data: {data}")
+
+
+def encode_base64(data: bytes) -> str:
+    # Base64 output is pure ASCII, which decodes faster than UTF-8
+    return pybase64.b64encode(data).decode("ascii")
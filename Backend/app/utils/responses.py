@@ -0,0 +1,10 @@
+from typing import Any
+import msgspec
+from fastapi.responses import Response
+
+
+class MsgspecResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return msgspec.json.encode(content)